@@ -10,11 +10,510 @@ Usage: python eq_who_tracker.py
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
+import sys
 import time
 import threading
-from datetime import datetime, timedelta
+import queue
+from datetime import datetime
 import re
 import json
+import tempfile
+import stat
+import functools
+import mmap
+import types
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:  # watchdog is optional - fall back to polling the log file
+    Observer = None
+    FileSystemEventHandler = object
+
+# Log files are read in binary through a 1 MiB buffer and decoded per line
+_LOG_BUFFER_SIZE = 1 << 20
+
+# With watchdog running, the log is still polled this often in case events are missed
+_BACKSTOP_POLL_SECONDS = 3
+
+# Read once at import, before any other thread could create files while it's cleared
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Large result lists are inserted into the listbox this many rows at a time
+_LISTBOX_CHUNK_SIZE = 500
+
+# Historical windows at least this large are split across worker processes. The
+# single-process scan handles roughly 50-100 MB/s, while each spawned worker
+# re-imports this module (tkinter, watchdog) - on Windows, and worse from the
+# one-file .exe, that costs around a second before any parsing starts. Below a
+# few seconds of serial work the pool loses, so only windows this big use it.
+_PARALLEL_SCAN_MIN_BYTES = 256 << 20
+_WHO_START_MARKER = b'Players on EverQuest:'
+
+# The historical scan looks at its cancel event once every this many lines
+_CANCEL_CHECK_LINES = 4096
+
+# Regexes only look this far into a line - /who header and footer lines are far shorter,
+# so a corrupt multi-megabyte line can't stall the parser
+_TS_SCAN_LIMIT = 64
+_LINE_SCAN_LIMIT = 256
+
+# Precompiled patterns for the /who parsing hot paths
+_TS_RE = re.compile(r'^\[([^\]]+)\]')
+_COUNT_RE = re.compile(r'There are (\d+) players')
+_WHO_FOOTER_RE = re.compile(r'There are (\d+) players in (.+)\.')  # count and location in one match
+_SAFE1_RE = re.compile(r'[^\w\s-]')
+_SAFE2_RE = re.compile(r'[-\s]+')
+# Start (group 1) or end (group 2) of a /who block in a single scan
+_SENTINEL_RE = re.compile(r'(Players on EverQuest:)|(There are .*players in)')
+
+# Month abbreviations as they appear in EQ log timestamps
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
+# Characters allowed in /who class titles and player names
+_CLASS_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ')
+_NAME_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_')
+
+# Class name mapping for OpenDKP output (including EQ class titles)
+_CLASS_NAMES = (
+    'Warrior', 'Paladin', 'Ranger', 'Shadow Knight', 'Monk', 'Bard', 'Rogue', 'Shaman',
+    'Necromancer', 'Wizard', 'Magician', 'Enchanter', 'Druid', 'Cleric', 'Beastlord',
+    'Berserker', 'Unknown',
+)
+
+_CLASS_MAPPINGS = types.MappingProxyType({
+    # Standard classes map to themselves
+    **{name.lower(): name for name in _CLASS_NAMES},
+    
+    # Enchanter titles
+    'phantasmist': 'Enchanter',
+    'illusionist': 'Enchanter',
+    'beguiler': 'Enchanter',
+    'arch convoker': 'Enchanter',
+    'coercer': 'Enchanter',
+    
+    # Magician titles
+    'conjurer': 'Magician',
+    'elementalist': 'Magician',
+    'arch mage': 'Magician',
+    
+    # Wizard titles
+    'warlock': 'Wizard',
+    'sorcerer': 'Wizard',
+    'arcanist': 'Wizard',
+    
+    # Warrior titles
+    'myrmidon': 'Warrior',
+    'champion': 'Warrior',
+    'overlord': 'Warrior',
+    'warlord': 'Warrior',
+    
+    # Monk titles
+    'master': 'Monk',
+    'grandmaster': 'Monk',
+    'transcendent': 'Monk',
+    
+    # Cleric/Paladin titles
+    'templar': 'Paladin',
+    'crusader': 'Paladin',
+    'knight': 'Paladin',
+    'cavalier': 'Paladin',
+    
+    # Shadow Knight titles
+    'heretic': 'Shadow Knight',
+    'reaver': 'Shadow Knight',
+    'blackguard': 'Shadow Knight',
+    
+    # Common alternatives
+    'sk': 'Shadow Knight',
+    'shadowknight': 'Shadow Knight',
+    'enc': 'Enchanter',
+    'mag': 'Magician',
+    'wiz': 'Wizard',
+    'nec': 'Necromancer',
+    'war': 'Warrior',
+    'pal': 'Paladin',
+    'ran': 'Ranger',
+    'rog': 'Rogue',
+    'mnk': 'Monk',
+    'shm': 'Shaman',
+    'dru': 'Druid',
+    'cle': 'Cleric',
+    'bst': 'Beastlord',
+    'ber': 'Berserker',
+    
+    # Alternative names
+    'minstrel': 'Bard',
+    'troubadour': 'Bard',
+})
+
+# Same mapping keyed by the title-cased names /who actually prints, so most lookups skip lower()
+_CLASS_MAPPINGS_CASED = types.MappingProxyType({
+    **{key.title(): value for key, value in _CLASS_MAPPINGS.items()},
+    **_CLASS_MAPPINGS,
+})
+
+def _iter_opendkp_lines(who_content):
+    """Yield the OpenDKP tab-separated row for each player line of a /who result"""
+    lines = who_content.split('\n')
+    for line in lines:
+        # Player lines always start with '[' - this also skips separator and summary lines
+        if line[:1] != '[':
+            # Only pasted text can be indented; trailing whitespace doesn't affect parsing
+            line = line.strip()
+            if line[:1] != '[':
+                continue
+        if ']' not in line[1:] or 'Players on EverQuest' in line:
+            continue
+        
+        # Parse player lines - look for [Level Class] Name or [ANONYMOUS] Class
+        # Remove timestamp prefix if present
+        if line.startswith('[') and '] [' in line:
+            parts = line.split('] ', 1)
+            if len(parts) > 1:
+                line = parts[1]
+        
+        # Split "[Level ClassTitle] PlayerName ..." or "[ANONYMOUS] PlayerName ..." by hand
+        close = line.find(']')
+        if line[:1] != '[' or close == -1:
+            continue  # Skip lines we can't parse
+        inner = line[1:close]
+        rest = line[close + 1:]
+        if not rest[:1].isspace():
+            continue
+            
+        if inner == 'ANONYMOUS':
+            level = "0"  # Unknown level for anonymous
+            class_name = "Unknown"  # No class info for anonymous
+        else:
+            level_class = inner.split(None, 1)
+            if (len(level_class) != 2 or not inner[:1].isdecimal() or not level_class[0].isdecimal()
+                    or not _CLASS_CHARS.issuperset(level_class[1])):
+                continue
+            level = level_class[0]
+            class_name = level_class[1].strip()
+            
+        # Player name runs until the first character that can't be in a name
+        words = rest.split(None, 1)
+        if not words:
+            continue
+        player_name = words[0]
+        if not _NAME_CHARS.issuperset(player_name):
+            name_end = next(i for i, ch in enumerate(player_name) if ch not in _NAME_CHARS)
+            player_name = player_name[:name_end]
+            if not player_name:
+                continue
+        
+        # Normalize class name
+        normalized_class = _CLASS_MAPPINGS_CASED.get(class_name)
+        if normalized_class is None:
+            normalized_class = _CLASS_MAPPINGS.get(class_name.lower(), class_name)
+        
+        # OpenDKP row: 0\tPlayerName\tLevel\tClass
+        yield '\t'.join(('0', player_name, level, normalized_class))
+
+def _write_file_atomic(file_path, data):
+    """Write bytes to a fresh temp file beside file_path, then swap it into place with os.replace"""
+    tmp_file = tempfile.NamedTemporaryFile(dir=os.path.dirname(os.path.abspath(file_path)),
+                                           suffix='.tmp', delete=False)
+    try:
+        with tmp_file:
+            tmp_file.write(data)
+        # The temp file is created owner-only - give it the target's mode, or the
+        # mode a plain open() would have given a new file
+        try:
+            mode = stat.S_IMODE(os.stat(file_path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp_file.name, mode)
+        os.replace(tmp_file.name, file_path)
+    except BaseException:
+        # Don't leave the temp file behind when the write or the swap fails
+        try:
+            os.unlink(tmp_file.name)
+        except OSError:
+            pass
+        raise
+
+@functools.lru_cache(maxsize=4096)
+def _parse_eq_timestamp(timestamp_str):
+    """Parse an EverQuest timestamp string to a datetime, or None if it can't be parsed"""
+    # Fixed-width fast path: "Wed Oct 16 14:23:45 2024"
+    if len(timestamp_str) == 24 and timestamp_str[13] == ':' and timestamp_str[16] == ':':
+        try:
+            return datetime(int(timestamp_str[20:24]), _MONTHS[timestamp_str[4:7]], int(timestamp_str[8:10]),
+                            int(timestamp_str[11:13]), int(timestamp_str[14:16]), int(timestamp_str[17:19]))
+        except (KeyError, ValueError):
+            pass
+    try:
+        # EQ timestamp format: "Wed Oct 16 14:23:45 2024"
+        return datetime.strptime(timestamp_str, "%a %b %d %H:%M:%S %Y")
+    except ValueError:
+        try:
+            # Try alternative format without year
+            current_year = datetime.now().year
+            return datetime.strptime(f"{timestamp_str} {current_year}", "%a %b %d %H:%M:%S %Y")
+        except ValueError:
+            # Not cached as "now" - the caller decides what a bad stamp means
+            return None
+
+def _parse_who_block(lines):
+    """Build a result from one complete /who block (start line first, end line last)"""
+    # Extract and parse timestamp once per block, compare as epoch seconds
+    timestamp_match = _TS_RE.match(lines[0], 0, _TS_SCAN_LIMIT) if lines[0][:1] == '[' else None
+    if timestamp_match:
+        who_timestamp = timestamp_match.group(1)
+        parsed = _parse_eq_timestamp(who_timestamp)
+        who_epoch = int(parsed.timestamp()) if parsed is not None else int(time.time())
+    else:
+        who_timestamp = datetime.now().strftime("%a %b %d %H:%M:%S %Y")
+        who_epoch = int(time.time())
+        
+    # Extract player count and location from the end line in one match
+    footer_match = _WHO_FOOTER_RE.search(lines[-1], 0, _LINE_SCAN_LIMIT)
+    if footer_match:
+        player_count, location = footer_match.groups()
+    else:
+        count_match = _COUNT_RE.search(lines[-1], 0, _LINE_SCAN_LIMIT)
+        player_count = count_match.group(1) if count_match else "?"
+        location = "Unknown"
+    
+    return {
+        'timestamp': who_timestamp,
+        'content': '\n'.join(lines),
+        'location': location,
+        'player_count': player_count,
+        'display_name': f"[{who_timestamp}] {player_count} players in {location}",
+        'epoch': who_epoch
+    }
+
+def _find_who_window_start(mm, cutoff_time):
+    """Return the offset just past the newest /who start line older than cutoff_time (0 if none)"""
+    end = len(mm)
+    while True:
+        marker_pos = mm.rfind(_WHO_START_MARKER, 0, end)
+        if marker_pos == -1:
+            return 0
+        line_start = mm.rfind(b'\n', 0, marker_pos) + 1
+        timestamp_match = _TS_RE.match(mm[line_start:min(marker_pos, line_start + _TS_SCAN_LIMIT)].decode('utf-8', 'ignore'))
+        if timestamp_match:
+            started = _parse_eq_timestamp(timestamp_match.group(1))
+            if started is not None and int(started.timestamp()) < cutoff_time:
+                line_end = mm.find(b'\n', marker_pos)
+                return len(mm) if line_end == -1 else line_end + 1
+        end = line_start
+
+def _find_who_start_line(mm, pos, end):
+    """Return the offset of the first /who start line beginning in [pos, end), or end if there is none"""
+    while True:
+        marker_pos = mm.find(_WHO_START_MARKER, pos, end)
+        if marker_pos == -1:
+            return end
+        line_start = mm.rfind(b'\n', 0, marker_pos) + 1
+        line_end = mm.find(b'\n', marker_pos)
+        if line_end == -1:
+            line_end = len(mm)
+        # Skip a line that began before pos, and one that also reads as an end line
+        line = mm[line_start:line_end].decode('utf-8', 'ignore')
+        if line_start >= pos and not ('There are' in line and 'players in' in line):
+            return line_start
+        pos = line_end
+
+def _collect_who_results_reverse(lines, cutoff_time, cancel_event=None):
+    """Collect /who results newer than cutoff_time from lines given last-to-first.
+    
+    Stops early (with the results so far) once cancel_event is set.
+    """
+    results = []
+    current_who = []  # Lines of the current block, newest first
+    in_who_result = False
+
+    for line_number, line in enumerate(lines):
+        # Checked by line count, not per block - a window can be all chat
+        if cancel_event is not None and not line_number % _CANCEL_CHECK_LINES and cancel_event.is_set():
+            break
+            
+        line = line.rstrip()
+        if not line:
+            continue
+
+        # Reading backwards, a /who result starts at its "There are ..." line
+        if 'There are' in line and 'players in' in line:
+            # A block that ends before the window also started before it - stop
+            # here instead of buffering a block that would only be discarded
+            end_match = _TS_RE.match(line, 0, _TS_SCAN_LIMIT) if line[:1] == '[' else None
+            if end_match:
+                end_time = _parse_eq_timestamp(end_match.group(1))
+                if end_time is not None and int(end_time.timestamp()) < cutoff_time:
+                    break
+
+            in_who_result = True
+            current_who.clear()  # Reuse one buffer across blocks
+            current_who.append(line)
+            continue
+
+        if in_who_result:
+            current_who.append(line)
+
+            # ... and is complete at the "Players on EverQuest:" line
+            if 'Players on EverQuest:' in line:
+                current_who.reverse()
+                result = _parse_who_block(current_who)
+                if result['epoch'] < cutoff_time:
+                    break  # Everything earlier in the log is older still
+                results.append(result)
+
+                in_who_result = False
+                current_who.clear()
+    return results
+
+def _parse_who_window_reverse(file_path, cutoff_time, cancel_event=None):
+    """Parse /who results newer than cutoff_time by reading the log backwards from the end"""
+    return _collect_who_results_reverse(_iter_lines_reverse(file_path), cutoff_time, cancel_event)
+
+def _parse_who_range(file_path, start, end, cutoff_time):
+    """Parse the /who blocks in [start, end) of the log - runs in a worker process.
+    
+    Ranges begin at a start line, so no block crosses into the previous range
+    and the same backwards scan as the single-process path applies.
+    """
+    with open(file_path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    with mm:
+        return _collect_who_results_reverse(_iter_mmap_lines_reverse(mm, start, end), cutoff_time)
+
+def _parse_who_window_parallel(file_path, cutoff_time, cancel_event=None):
+    """Parse a large historical window across worker processes.
+    
+    Returns None if the window isn't worth a pool, the pool fails, or
+    cancel_event is set while the workers run.
+    """
+    # ProcessPoolExecutor refuses more than 61 workers on Windows
+    workers = min(os.cpu_count() or 1, 61)
+    if workers < 2 or sys.version_info < (3, 7):  # mp_context needs 3.7
+        return None
+    if os.path.getsize(file_path) < _PARALLEL_SCAN_MIN_BYTES:
+        return None
+        
+    with open(file_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, OverflowError, MemoryError):
+            return None
+    with mm:
+        window_start = _find_who_window_start(mm, cutoff_time)
+        window_end = len(mm)
+        if window_end - window_start < _PARALLEL_SCAN_MIN_BYTES:
+            return None
+            
+        # Roughly equal byte ranges, each moved forward to the next start line
+        step = -(-(window_end - window_start) // workers)
+        bounds = [window_start]
+        for i in range(1, workers):
+            bound = _find_who_start_line(mm, window_start + i * step, window_end)
+            if bound > bounds[-1]:
+                bounds.append(bound)
+        if bounds[-1] < window_end:
+            bounds.append(window_end)
+            
+    pool = None
+    parts = None
+    cancelled = False
+    try:
+        # spawn rather than fork: this runs on a worker thread next to Tk and watchdog threads
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        futures = [pool.submit(_parse_who_range, file_path, start, end, cutoff_time)
+                   for start, end in zip(bounds[:-1], bounds[1:])]
+        pending = futures
+        while pending:
+            if cancel_event is not None and cancel_event.is_set():
+                for future in futures:
+                    future.cancel()  # shutdown(cancel_futures=True) needs 3.9
+                cancelled = True
+                break
+            pending = wait(pending, timeout=0.2).not_done
+        else:
+            parts = [future.result() for future in futures]
+    except (OSError, ValueError, MemoryError, BrokenProcessPool):
+        pass  # Fall back to the single-process scan
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=parts is not None)
+            
+    if cancelled:
+        # Ranges already running would otherwise hold up interpreter exit
+        for process in multiprocessing.active_children():
+            process.terminate()
+    if parts is None:
+        return None
+        
+    # Newest range first, the same order the backwards scan produces
+    return [result for part in reversed(parts) for result in part]
+
+def _iter_mmap_lines_reverse(mm, start, end):
+    """Yield the decoded lines of mm[start:end] from the last line back to the first"""
+    while True:
+        newline = mm.rfind(b'\n', start, end)
+        line_start = newline + 1 if newline != -1 else start
+        yield mm[line_start:end].decode('utf-8', 'ignore')
+        if newline == -1:
+            break
+        end = newline
+
+def _iter_lines_reverse(file_path, chunk_size=_LOG_BUFFER_SIZE):
+    """Yield the decoded lines of a file from the last line back to the first.
+    
+    The file is memory-mapped so lines are found with rfind() straight from
+    the page cache; files that can't be mapped (empty, unmappable filesystem,
+    too large for the address space) are read backwards in chunks instead.
+    """
+    with open(file_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, OverflowError, MemoryError):
+            mm = None
+            
+        if mm is None:
+            yield from _iter_chunked_lines_reverse(f, chunk_size)
+            return
+            
+    with mm:
+        yield from _iter_mmap_lines_reverse(mm, 0, len(mm))
+
+def _iter_chunked_lines_reverse(f, chunk_size):
+    """Yield the decoded lines of an open binary file backwards, reading chunk_size at a time"""
+    f.seek(0, os.SEEK_END)
+    pos = f.tell()
+    partial = b''
+    while pos > 0:
+        read_size = min(chunk_size, pos)
+        pos -= read_size
+        f.seek(pos)
+        lines = (f.read(read_size) + partial).split(b'\n')
+        # The first piece may continue in the previous chunk
+        partial = lines[0]
+        for line in reversed(lines[1:]):
+            yield line.decode('utf-8', 'ignore')
+    yield partial.decode('utf-8', 'ignore')
+
+class LogFileEventHandler(FileSystemEventHandler):
+    """Forward watchdog modification events for the tracked log file"""
+    def __init__(self, tracker):
+        super().__init__()
+        self.tracker = tracker
+        self.watched_path = os.path.normcase(os.path.abspath(tracker.log_file_path))
+        
+    def on_modified(self, event):
+        """Called on the observer thread for every change in the log directory"""
+        if os.path.normcase(os.path.abspath(event.src_path)) == self.watched_path:
+            self.tracker.on_log_file_modified()
 
 class EQWhoTracker:
     def __init__(self):
@@ -28,11 +527,24 @@ class EQWhoTracker:
         self.monitoring = False
         self.last_file_size = 0
         self.initial_file_size = 0
-        self.who_results = []
+        # Captured results as parallel lists, one entry per result (oldest first)
+        self._timestamps = []
+        self._contents = []
+        self._locations = []
+        self._counts = []
+        self._display_names = []
+        self._seen_keys = set()  # (timestamp, content) of every captured result
         self.selected_result_index = None
         self.selected_listbox_index = None  # Track listbox selection separately
         self.monitor_thread = None
+        self.observer = None  # watchdog observer when available
+        self._read_lock = threading.Lock()  # One reader of new log content at a time
         self.stop_monitoring = False
+        self._result_queue = queue.Queue()  # (content, timestamp) or UI callables from worker threads
+        self.reset_live_parser()
+        self._added_count = 0  # Results ever added; tells a historical load which live ones arrived during it
+        self._cancel_load = threading.Event()  # Set by the Cancel button during a historical load
+        self._fill_generation = 0  # Bumped whenever the listbox is cleared, to drop stale chunk inserts
         
         # Load settings
         self.settings_file = "eq_tracker_settings.json"
@@ -41,51 +553,35 @@ class EQWhoTracker:
         self.create_widgets()
         self.setup_styles()
         
+        # Periodically move queued results into the UI
+        self._drain_after_id = self.root.after(50, self._drain_results)
+        
         # Auto-load last used file if it exists
         if self.log_file_path and os.path.exists(self.log_file_path):
             self.load_log_file(self.log_file_path)
             
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
-    def prevent_edit(self, event):
-        """Prevent editing but allow copy operations and navigation"""
-        # Allow copy operations
-        if event.state & 4 and event.keysym.lower() == 'c':  # Ctrl+C
-            return  # Allow copy
-        if event.state & 4 and event.keysym.lower() == 'a':  # Ctrl+A (select all)
-            return  # Allow select all
-        
-        # Allow navigation keys
-        navigation_keys = {'Up', 'Down', 'Left', 'Right', 'Home', 'End', 'Page_Up', 'Page_Down'}
-        if event.keysym in navigation_keys:
-            return  # Allow navigation
-            
-        # Block all editing keys (typing, delete, backspace, etc.)
-        return "break"
-        
-    def update_default_text(self):
-        """Update the default text in result panel"""
+    def set_result_text(self, text):
+        """Replace the result panel text (the widget is read-only otherwise)"""
         self.result_text.config(state='normal')
         self.result_text.delete('1.0', tk.END)
+        self.result_text.insert('1.0', text)
+        self.result_text.config(state='disabled')
         
-        if self.who_results:
-            # Show most recent result
-            recent_result = self.who_results[-1]  # Last added (most recent)
-            self.result_text.insert('1.0', f"Most Recent /who Result:\n")
-            self.result_text.insert(tk.END, f"Location: {recent_result['location']}\n")
-            self.result_text.insert(tk.END, f"Player Count: {recent_result['player_count']}\n")
-            self.result_text.insert(tk.END, f"Timestamp: {recent_result['timestamp']}\n")
-            self.result_text.insert(tk.END, "\n" + "="*50 + "\n\n")
-            self.result_text.insert(tk.END, recent_result['content'])
+    def update_default_text(self):
+        """Update the default text in result panel"""
+        if self._contents:
+            # Show most recent result (last added)
+            self.set_result_text(f"Most Recent /who Result:\n"
+                                 f"Location: {self._locations[-1]}\n"
+                                 f"Player Count: {self._counts[-1]}\n"
+                                 f"Timestamp: {self._timestamps[-1]}\n"
+                                 "\n" + "="*50 + "\n\n" +
+                                 self._contents[-1])
         else:
-            self.result_text.insert('1.0', "Select a result from the list to view details")
-
-    def allow_selection(self, event):
-        """Allow mouse events for proper text selection"""
-        # Don't interfere with text selection - let tkinter handle it naturally
-        # This ensures clicking, dragging, and double-clicking work properly
-        return
-        
+            self.set_result_text("Select a result from the list to view details")
+            
     def setup_styles(self):
         """Configure custom styles for better appearance"""
         style = ttk.Style()
@@ -178,6 +674,10 @@ class EQWhoTracker:
                                        command=lambda: self.load_historical_data(1440), style='Primary.TButton')
         self.load_1day_btn.pack(side='left', padx=(0, 5))
         
+        self.cancel_load_btn = ttk.Button(control_bottom, text="✖ Cancel", 
+                                         command=self.cancel_historical_load, style='Danger.TButton', state='disabled')
+        self.cancel_load_btn.pack(side='left', padx=(0, 5))
+        
         # Status display - now has its own space on the right
         self.status_label = tk.Label(control_bottom, text="Status: Ready to select log file", 
                                     font=('Arial', 10, 'bold'), bg='#f0f0f0', fg='#007bff',
@@ -247,18 +747,12 @@ class EQWhoTracker:
         text_frame.pack(fill='both', expand=True, padx=2, pady=2)
         
         self.result_text = tk.Text(text_frame, wrap='word', font=('Courier New', 9), 
-                                  bg='#f8f9fa', height=15, state='normal')
+                                  bg='#f8f9fa', height=15, state='disabled')
         text_scrollbar = tk.Scrollbar(text_frame, orient='vertical', command=self.result_text.yview)
         self.result_text.configure(yscrollcommand=text_scrollbar.set)
         
-        # Bind events to prevent editing but allow selection
-        self.result_text.bind('<KeyPress>', self.prevent_edit)
-        # Allow all mouse events for proper text selection
-        self.result_text.bind('<Button-1>', self.allow_selection)
-        self.result_text.bind('<B1-Motion>', self.allow_selection)
-        self.result_text.bind('<ButtonRelease-1>', self.allow_selection)
-        self.result_text.bind('<Double-Button-1>', self.allow_selection)
-        self.result_text.bind('<Triple-Button-1>', self.allow_selection)
+        # Read-only (state='disabled') but selectable; take focus on click so Ctrl+C works everywhere
+        self.result_text.bind('<Button-1>', lambda e: self.result_text.focus_set())
         
         self.result_text.pack(side='left', fill='both', expand=True)
         text_scrollbar.pack(side='right', fill='y')
@@ -327,6 +821,7 @@ class EQWhoTracker:
             # Set initial file size baseline (only capture new content)
             self.initial_file_size = os.path.getsize(self.log_file_path)
             self.last_file_size = self.initial_file_size
+            self.reset_live_parser()
             
             # Update UI
             self.monitoring = True
@@ -335,8 +830,20 @@ class EQWhoTracker:
             self.stop_btn.config(state='normal')
             self.update_status("🟢 Monitoring Active - Watching for new /who results", '#28a745')
             
-            # Start monitoring thread
-            self.monitor_thread = threading.Thread(target=self.monitor_file, daemon=True)
+            poll_interval = 1  # Check every second without watchdog
+            if Observer is not None:
+                # Block in the OS notifier until the log actually changes
+                self.observer = Observer()
+                self.observer.daemon = True
+                self.observer.schedule(LogFileEventHandler(self),
+                                       os.path.dirname(os.path.abspath(self.log_file_path)))
+                self.observer.start()
+                # Windows can hold back change events while EverQuest keeps the log open,
+                # so a slow poll still runs as a backstop
+                poll_interval = _BACKSTOP_POLL_SECONDS
+                
+            # Start polling thread
+            self.monitor_thread = threading.Thread(target=self.monitor_file, args=(poll_interval,), daemon=True)
             self.monitor_thread.start()
             
         except Exception as e:
@@ -347,32 +854,27 @@ class EQWhoTracker:
         self.monitoring = False
         self.stop_monitoring = True
         
+        if self.observer is not None:
+            self.observer.stop()
+            # Bounded join - the handler may be waiting on this (Tk) thread
+            self.observer.join(timeout=1.0)
+            self.observer = None
+        
         self.start_btn.config(state='normal')
         self.stop_btn.config(state='disabled')
         self.update_status("⏹ Monitoring Stopped", '#dc3545')
         
-    def monitor_file(self):
-        """Background thread to monitor the log file"""
+    def monitor_file(self, poll_interval=1):
+        """Background thread to poll the log file (a slow backstop when watchdog is running)"""
         while self.monitoring and not self.stop_monitoring:
             try:
                 if not os.path.exists(self.log_file_path):
                     self.root.after(0, lambda: self.update_status("❌ Log file not found!", '#dc3545'))
                     break
                     
-                current_size = os.path.getsize(self.log_file_path)
-                
-                if current_size > self.last_file_size:
-                    # Read only the new content
-                    with open(self.log_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        f.seek(self.last_file_size)
-                        new_content = f.read()
-                        
-                    self.last_file_size = current_size
+                self.read_new_content()
                     
-                    # Parse for /who results
-                    self.parse_who_results(new_content)
-                    
-                time.sleep(1)  # Check every second
+                time.sleep(poll_interval)
                 
             except Exception as e:
                 self.root.after(0, lambda: self.update_status(f"❌ Monitoring error: {str(e)}", '#dc3545'))
@@ -380,27 +882,71 @@ class EQWhoTracker:
                 
         self.monitoring = False
         
-    def parse_who_results(self, content):
-        """Parse content for /who results"""
-        if not content.strip():
+    def on_log_file_modified(self):
+        """Handle a watchdog modification event for the log file"""
+        if not self.monitoring or self.stop_monitoring:
             return
             
-        lines = content.split('\n')
-        current_who = []
-        in_who_result = False
-        who_timestamp = None
-        
-        for line in lines:
-            line = line.strip()
+        try:
+            self.read_new_content()
+        except Exception as e:
+            error_msg = f"❌ Monitoring error: {str(e)}"
+            self.root.after(0, lambda: self.update_status(error_msg, '#dc3545'))
+            
+    def read_new_content(self):
+        """Read and parse anything appended to the log since the last check"""
+        # The watchdog thread and the backstop poll can both get here
+        with self._read_lock:
+            current_size = os.path.getsize(self.log_file_path)
+            
+            if current_size > self.last_file_size:
+                # Stream only the new content straight into the parser
+                with open(self.log_file_path, 'rb', buffering=_LOG_BUFFER_SIZE) as f:
+                    f.seek(self.last_file_size)
+                    self.parse_who_results_stream(self._iter_complete_lines(f))
+
+    def _iter_complete_lines(self, f):
+        """Yield the decoded lines of f up to its last newline, counting them into last_file_size"""
+        for line in f:
+            if not line.endswith(b'\n'):
+                break  # EverQuest is still writing this line - read it whole next time
+            self.last_file_size += len(line)
+            yield line.decode('utf-8', 'ignore')
+            
+    def reset_live_parser(self):
+        """Forget any /who block left open by the last read of new log content"""
+        self._who_lines = []  # Lines of the open block
+        self._in_who_result = False
+        self._who_timestamp = None
+        
+    def parse_who_results_stream(self, line_iter):
+        """Parse /who results from an iterable of lines (e.g. an open file).
+        
+        A block still open at the end carries over to the next call, since a
+        change event can fire while EverQuest is partway through writing it.
+        """
+        current_who = self._who_lines
+        in_who_result = self._in_who_result
+        who_timestamp = self._who_timestamp
+        
+        for line in line_iter:
+            # Outside a block only a start line matters - skip chat without stripping it
+            if not in_who_result and 'Players on EverQuest:' not in line:
+                continue
+                
+            line = line.rstrip()
             if not line:
                 continue
                 
+            sentinel = _SENTINEL_RE.search(line, 0, _LINE_SCAN_LIMIT)
+            
             # Look for start of /who result
-            if 'Players on EverQuest:' in line:
+            if sentinel and sentinel.group(1):
                 in_who_result = True
-                current_who = [line]
+                current_who.clear()  # Reuse one buffer across blocks
+                current_who.append(line)
                 # Extract timestamp
-                timestamp_match = re.match(r'^\[([^\]]+)\]', line)
+                timestamp_match = _TS_RE.match(line, 0, _TS_SCAN_LIMIT)
                 who_timestamp = timestamp_match.group(1) if timestamp_match else datetime.now().strftime("%a %b %d %H:%M:%S %Y")
                 continue
                 
@@ -408,49 +954,96 @@ class EQWhoTracker:
                 current_who.append(line)
                 
                 # Look for end of /who result
-                if 'There are' in line and 'players in' in line:
+                if sentinel:
                     # Complete /who result found
                     who_content = '\n'.join(current_who)
-                    self.root.after(0, lambda w=who_content, t=who_timestamp: self.add_who_result(w, t))
+                    self._result_queue.put((who_content, who_timestamp))
                     
                     in_who_result = False
-                    current_who = []
+                    current_who.clear()
                     who_timestamp = None
                     
-    def add_who_result(self, content, timestamp):
-        """Add a new /who result to the list"""
-        # Check for duplicates
-        for existing in self.who_results:
-            if existing['content'] == content and existing['timestamp'] == timestamp:
-                return  # Duplicate found, don't add
+        self._in_who_result = in_who_result
+        self._who_timestamp = who_timestamp
+                    
+    def _drain_results(self):
+        """Add queued /who results to the UI in one batch (runs on the Tk thread)"""
+        try:
+            batch_start = len(self._contents)
+            pending = []
+            try:
+                for _ in range(128):
+                    item = self._result_queue.get_nowait()
+                    if callable(item):
+                        # UI step queued by a worker - run it in order with the results
+                        self.add_who_results(pending)
+                        pending.clear()
+                        self.show_added_results(batch_start)
+                        item()
+                        batch_start = len(self._contents)
+                        continue
+                        
+                    pending.append(item)
+            except queue.Empty:
+                pass
                 
-        # Extract location and player count for display
-        location_match = re.search(r'There are \d+ players in (.+)\.', content)
-        location = location_match.group(1) if location_match else "Unknown"
-        
-        count_match = re.search(r'There are (\d+) players', content)
-        player_count = count_match.group(1) if count_match else "?"
-        
-        result = {
-            'timestamp': timestamp,
-            'content': content,
-            'location': location,
-            'player_count': player_count,
-            'display_name': f"[{timestamp}] {player_count} players in {location}"
-        }
-        
-        self.who_results.append(result)
-        
-        # Update UI
-        self.results_listbox.insert(0, result['display_name'])  # Add to top
+            self.add_who_results(pending)
+            self.show_added_results(batch_start)
+        finally:
+            # Keep draining even if one batch fails, or live captures stop for good
+            self._drain_after_id = self.root.after(50, self._drain_results)
+        
+    def show_added_results(self, batch_start):
+        """Update the UI once for the results added from index batch_start on"""
+        if batch_start >= len(self._contents):
+            return
+            
+        # Newest goes on top
+        self.results_listbox.insert(0, *reversed(self._display_names[batch_start:]))
         self.update_count_label()
         
         # Update default text to show most recent result
         if not self.selected_result_index:  # Only if no specific result is selected
             self.update_default_text()
-        
+            
         # Show brief notification in status
-        self.update_status(f"✅ New /who captured: {player_count} players in {location}", '#28a745')
+        self.update_status(f"✅ New /who captured: {self._counts[-1]} players in {self._locations[-1]}", '#28a745')
+        
+    def add_who_results(self, items):
+        """Record a batch of (content, timestamp) results; returns how many were new"""
+        timestamps, contents, locations, counts, display_names = [], [], [], [], []
+        seen_keys = self._seen_keys
+        for content, timestamp in items:
+            # Check for duplicates
+            key = (timestamp, content)
+            if key in seen_keys:
+                continue  # Duplicate found, don't add
+            seen_keys.add(key)
+            
+            # Extract player count and location from the end line in one match
+            end_line = content[content.rfind('\n') + 1:]
+            footer_match = _WHO_FOOTER_RE.search(end_line, 0, _LINE_SCAN_LIMIT)
+            if footer_match:
+                player_count, location = footer_match.groups()
+            else:
+                count_match = _COUNT_RE.search(end_line, 0, _LINE_SCAN_LIMIT)
+                player_count = count_match.group(1) if count_match else "?"
+                location = "Unknown"
+            
+            timestamps.append(timestamp)
+            contents.append(content)
+            locations.append(location)
+            counts.append(player_count)
+            display_names.append(f"[{timestamp}] {player_count} players in {location}")
+            
+        # One extend per column instead of five appends per result
+        self._timestamps.extend(timestamps)
+        self._contents.extend(contents)
+        self._locations.extend(locations)
+        self._counts.extend(counts)
+        self._display_names.extend(display_names)
+        self._added_count += len(contents)
+        return len(contents)
         
     def on_result_select(self, event):
         """Handle result selection from listbox"""
@@ -458,9 +1051,7 @@ class EQWhoTracker:
         if not selection:
             self.selected_result_index = None
             self.selected_listbox_index = None
-            self.result_text.config(state='normal')
-            self.result_text.delete('1.0', tk.END)
-            self.result_text.insert('1.0', "Select a result from the list to view details")
+            self.set_result_text("Select a result from the list to view details")
             self.copy_btn.config(state='disabled')
             self.opendkp_btn.config(state='disabled')
             self.save_btn.config(state='disabled')
@@ -469,20 +1060,17 @@ class EQWhoTracker:
         # Get selected result (remember list is reversed)
         list_index = selection[0]
         self.selected_listbox_index = list_index  # Store listbox selection
-        result_index = len(self.who_results) - 1 - list_index
+        result_index = len(self._contents) - 1 - list_index
         
-        if 0 <= result_index < len(self.who_results):
+        if 0 <= result_index < len(self._contents):
             self.selected_result_index = result_index
-            result = self.who_results[result_index]
             
-            # Display result content - ensure widget is editable for programmatic updates
-            self.result_text.config(state='normal')
-            self.result_text.delete('1.0', tk.END)
-            self.result_text.insert('1.0', f"Timestamp: {result['timestamp']}\n")
-            self.result_text.insert(tk.END, f"Location: {result['location']}\n")
-            self.result_text.insert(tk.END, f"Player Count: {result['player_count']}\n")
-            self.result_text.insert(tk.END, "\n" + "="*50 + "\n\n")
-            self.result_text.insert(tk.END, result['content'])
+            # Display result content
+            self.set_result_text(f"Timestamp: {self._timestamps[result_index]}\n"
+                                 f"Location: {self._locations[result_index]}\n"
+                                 f"Player Count: {self._counts[result_index]}\n"
+                                 "\n" + "="*50 + "\n\n" +
+                                 self._contents[result_index])
             
             self.copy_btn.config(state='normal')
             self.opendkp_btn.config(state='normal')
@@ -493,8 +1081,8 @@ class EQWhoTracker:
         if self.selected_result_index is None:
             return
             
-        result = self.who_results[self.selected_result_index]
-        content = f"[{result['timestamp']}]\n{result['content']}"
+        index = self.selected_result_index
+        content = f"[{self._timestamps[index]}]\n{self._contents[index]}"
         
         self.root.clipboard_clear()
         self.root.clipboard_append(content)
@@ -507,8 +1095,7 @@ class EQWhoTracker:
         if self.selected_result_index is None:
             return
             
-        result = self.who_results[self.selected_result_index]
-        opendkp_content = self.convert_to_opendkp_format(result['content'])
+        opendkp_content = self.convert_to_opendkp_format(self._contents[self.selected_result_index])
         
         if not opendkp_content.strip():
             messagebox.showwarning("No Data", "No valid player data found to convert to OpenDKP format.")
@@ -524,136 +1111,13 @@ class EQWhoTracker:
     
     def convert_to_opendkp_format(self, who_content):
         """Convert /who result content to OpenDKP tab-separated format"""
-        lines = who_content.split('\n')
-        opendkp_lines = []
-        
-        # Class name mapping for consistency (including EQ class titles)
-        class_mappings = {
-            # Standard classes
-            'warrior': 'Warrior',
-            'paladin': 'Paladin',
-            'ranger': 'Ranger',
-            'shadow knight': 'Shadow Knight',
-            'monk': 'Monk',
-            'bard': 'Bard',
-            'rogue': 'Rogue',
-            'shaman': 'Shaman',
-            'necromancer': 'Necromancer',
-            'wizard': 'Wizard',
-            'magician': 'Magician',
-            'enchanter': 'Enchanter',
-            'druid': 'Druid',
-            'cleric': 'Cleric',
-            'beastlord': 'Beastlord',
-            'berserker': 'Berserker',
-            
-            # Enchanter titles
-            'phantasmist': 'Enchanter',
-            'illusionist': 'Enchanter',
-            'beguiler': 'Enchanter',
-            'arch convoker': 'Enchanter',
-            'coercer': 'Enchanter',
-            
-            # Magician titles
-            'conjurer': 'Magician',
-            'elementalist': 'Magician',
-            'arch mage': 'Magician',
-            'wizard': 'Wizard',
-            
-            # Wizard titles
-            'warlock': 'Wizard',
-            'sorcerer': 'Wizard',
-            'arcanist': 'Wizard',
-            
-            # Warrior titles
-            'myrmidon': 'Warrior',
-            'champion': 'Warrior',
-            'overlord': 'Warrior',
-            'warlord': 'Warrior',
-            
-            # Monk titles
-            'master': 'Monk',
-            'grandmaster': 'Monk',
-            'transcendent': 'Monk',
-            
-            # Cleric/Paladin titles
-            'templar': 'Paladin',
-            'crusader': 'Paladin',
-            'knight': 'Paladin',
-            'cavalier': 'Paladin',
-            
-            # Shadow Knight titles
-            'heretic': 'Shadow Knight',
-            'reaver': 'Shadow Knight',
-            'blackguard': 'Shadow Knight',
-            
-            # Common alternatives
-            'sk': 'Shadow Knight',
-            'shadowknight': 'Shadow Knight',
-            'enc': 'Enchanter',
-            'mag': 'Magician',
-            'wiz': 'Wizard',
-            'nec': 'Necromancer',
-            'war': 'Warrior',
-            'pal': 'Paladin',
-            'ran': 'Ranger',
-            'rog': 'Rogue',
-            'mnk': 'Monk',
-            'shm': 'Shaman',
-            'dru': 'Druid',
-            'cle': 'Cleric',
-            'bst': 'Beastlord',
-            'ber': 'Berserker',
-            
-            # Alternative names
-            'minstrel': 'Bard',
-            'troubadour': 'Bard',
-            'unknown': 'Unknown',
-        }
-        
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('[') and (']' not in line[1:] or 'Players on EverQuest' in line):
-                continue
-                
-            # Skip separator lines and summary lines
-            if line.startswith('---') or line.startswith('There are'):
-                continue
-            
-            # Parse player lines - look for [Level Class] Name or [ANONYMOUS] Class
-            player_match = None
-            
-            # Remove timestamp prefix if present
-            if line.startswith('[') and '] [' in line:
-                parts = line.split('] ', 1)
-                if len(parts) > 1:
-                    line = parts[1]
-            
-            # Try to match [Level ClassTitle] PlayerName (Race) <Guild> pattern first
-            player_match = re.match(r'^\[(\d+)\s+([A-Za-z ]+)\]\s+([A-Za-z0-9_]+)', line)
-            if player_match:
-                level = player_match.group(1)
-                class_name = player_match.group(2).strip()
-                player_name = player_match.group(3).strip()
-            else:
-                # Try to match [ANONYMOUS] PlayerName pattern
-                anon_match = re.match(r'^\[ANONYMOUS\]\s+([A-Za-z0-9_]+)', line)
-                if anon_match:
-                    level = "0"  # Unknown level for anonymous
-                    class_name = "Unknown"  # No class info for anonymous
-                    player_name = anon_match.group(1).strip()
-                else:
-                    continue  # Skip lines we can't parse
-            
-            # Normalize class name
-            class_name_lower = class_name.lower()
-            normalized_class = class_mappings.get(class_name_lower, class_name)
-            
-            # Create OpenDKP format: 0\tPlayerName\tLevel\tClass
-            opendkp_line = f"0\t{player_name}\t{level}\t{normalized_class}"
-            opendkp_lines.append(opendkp_line)
+        return self._convert_to_opendkp_cached(who_content)
         
-        return '\n'.join(opendkp_lines)
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _convert_to_opendkp_cached(who_content):
+        """Cached conversion keyed by content (repeat copies are a dict lookup)"""
+        return '\n'.join(_iter_opendkp_lines(who_content))
         
     def save_selected_result(self):
         """Save selected result to file"""
@@ -661,20 +1125,21 @@ class EQWhoTracker:
             messagebox.showwarning("No Selection", "Please select a result from the list first!")
             return
             
-        if not self.who_results or self.selected_result_index >= len(self.who_results):
+        if not self._contents or self.selected_result_index >= len(self._contents):
             messagebox.showerror("Error", "Selected result is no longer valid. Please select another result.")
             return
             
         try:
-            result = self.who_results[self.selected_result_index]
+            index = self.selected_result_index
+            timestamp = self._timestamps[index]
             
             # Generate filename with safe characters
-            safe_location = re.sub(r'[^\w\s-]', '', result['location']).strip()
-            safe_location = re.sub(r'[-\s]+', '_', safe_location)
+            safe_location = _SAFE1_RE.sub('', self._locations[index]).strip()
+            safe_location = _SAFE2_RE.sub('_', safe_location)
             
             # Create timestamp part from the timestamp
             try:
-                timestamp_parts = result['timestamp'].split()
+                timestamp_parts = timestamp.split()
                 if len(timestamp_parts) >= 3:
                     date_part = timestamp_parts[1] + "_" + timestamp_parts[2]
                 else:
@@ -697,10 +1162,10 @@ class EQWhoTracker:
             )
             
             if file_path:  # User didn't cancel
-                content = f"[{result['timestamp']}]\n{result['content']}"
+                content = f"[{timestamp}]\n{self._contents[index]}"
                 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                # Encode once (keeping the platform's text-mode newlines) and replace atomically
+                _write_file_atomic(file_path, content.replace('\n', os.linesep).encode('utf-8'))
                 
                 saved_filename = os.path.basename(file_path)
                 self.update_status(f"💾 Result saved as {saved_filename}", '#28a745')
@@ -713,23 +1178,31 @@ class EQWhoTracker:
                 
     def clear_results(self):
         """Clear all captured results"""
-        if not self.who_results:
+        if not self._contents:
             return
             
         if messagebox.askyesno("Confirm", "Are you sure you want to clear all captured results?"):
-            self.who_results.clear()
-            self.results_listbox.delete(0, tk.END)
-            self.selected_result_index = None
-            self.selected_listbox_index = None
-            
-            self.update_default_text()  # This will show the generic message since no results
-            
-            self.copy_btn.config(state='disabled')
-            self.opendkp_btn.config(state='disabled')
-            self.save_btn.config(state='disabled')
-            self.update_count_label()
-            
+            self.reset_results()
             self.update_status("🗑 All results cleared", '#dc3545')
+            
+    def reset_results(self):
+        """Drop all captured results and reset the result views"""
+        for column in (self._timestamps, self._contents, self._locations,
+                       self._counts, self._display_names):
+            column.clear()
+        self._seen_keys.clear()
+        self._convert_to_opendkp_cached.cache_clear()
+        self._fill_generation += 1
+        self.results_listbox.delete(0, tk.END)
+        self.selected_result_index = None
+        self.selected_listbox_index = None
+        
+        self.update_default_text()  # This will show the generic message since no results
+        
+        self.copy_btn.config(state='disabled')
+        self.opendkp_btn.config(state='disabled')
+        self.save_btn.config(state='disabled')
+        self.update_count_label()
     
     def load_historical_data(self, minutes_back):
         """Load historical /who results from the log file for the specified time period"""
@@ -737,138 +1210,119 @@ class EQWhoTracker:
             messagebox.showerror("Error", "Please select a valid log file first!")
             return
             
+        # Calculate cutoff time (epoch seconds)
+        cutoff_time = time.time() - minutes_back * 60
+        
+        # Parse on a worker thread so the UI stays responsive
+        self.update_status(f"🔍 Loading last {minutes_back} minutes of /who data...", '#007bff')
+        self.set_history_buttons_state('disabled')
+        self._cancel_load.clear()
+        
+        # Live results captured while the worker scans are kept when its results replace the list
+        worker = threading.Thread(target=self.load_historical_worker,
+                                  args=(self.log_file_path, cutoff_time, minutes_back, self._added_count), daemon=True)
+        worker.start()
+        
+    def load_historical_worker(self, file_path, cutoff_time, minutes_back, added_before):
+        """Background thread: parse historical results and queue them for the UI"""
         try:
-            # Calculate cutoff time
-            cutoff_time = datetime.now() - timedelta(minutes=minutes_back)
-            
-            # Read entire log file and parse historical data
-            self.update_status(f"🔍 Loading last {minutes_back} minutes of /who data...", '#007bff')
-            
-            historical_results = self.parse_historical_who_results(self.log_file_path, cutoff_time)
+            historical_results = self.parse_historical_who_results(file_path, cutoff_time, self._cancel_load)
+        except Exception as e:
+            error_msg = f"Error loading historical data: {str(e)}"
+            self._result_queue.put(lambda: self.historical_load_failed(error_msg))
+            return
             
-            if not historical_results:
-                time_desc = self.format_time_description(minutes_back)
-                messagebox.showinfo("No Results", f"No /who results found in the last {time_desc}")
-                self.update_status("No historical results found", '#dc3545')
-                return
+        if self._cancel_load.is_set():
+            # Leave the current results untouched
+            self._result_queue.put(self.historical_load_cancelled)
+            return
             
-            # Clear current results and load historical ones
-            self.who_results.clear()
-            self.results_listbox.delete(0, tk.END)
-            self.selected_result_index = None
+        self._result_queue.put(lambda: self.historical_load_finished(historical_results, minutes_back, added_before))
+        
+    def historical_load_finished(self, historical_results, minutes_back, added_before):
+        """Replace the results with the historical ones (runs on the Tk thread)"""
+        self.set_history_buttons_state('normal')
+        time_desc = self.format_time_description(minutes_back)
+        
+        if not historical_results:
+            messagebox.showinfo("No Results", f"No /who results found in the last {time_desc}")
+            self.update_status("No historical results found", '#dc3545')
+            return
             
-            # Add historical results (newest first)
-            for result in reversed(historical_results):
-                self.who_results.append(result)
-                self.results_listbox.insert(tk.END, result['display_name'])
+        # Live captures made during the scan may be past the end of what it read - keep them
+        live_count = min(self._added_count - added_before, len(self._contents))
+        live_results = list(zip(self._contents[len(self._contents) - live_count:],
+                                self._timestamps[len(self._timestamps) - live_count:]))
+        
+        self.reset_results()
+        self.add_who_results((result['content'], result['timestamp']) for result in historical_results)
+        self.add_who_results(live_results)  # Newer than the historical ones; duplicates are dropped
+        self.refresh_results_listbox()
+        
+        self.set_result_text("Select a result from the list to view details")
+        
+        # Duplicate blocks were dropped when added - report what the list actually holds
+        self.update_status(f"✅ Loaded {len(self._timestamps)} /who results from last {time_desc}", '#28a745')
+        
+    def historical_load_failed(self, error_msg):
+        """Report a failed historical load"""
+        self.set_history_buttons_state('normal')
+        messagebox.showerror("Error", error_msg)
+        self.update_status("❌ Failed to load historical data", '#dc3545')
+        
+    def cancel_historical_load(self):
+        """Ask the running historical load to stop"""
+        self._cancel_load.set()
+        self.cancel_load_btn.config(state='disabled')
+        self.update_status("Cancelling historical load...", '#007bff')
+        
+    def historical_load_cancelled(self):
+        """Report a cancelled historical load"""
+        self.set_history_buttons_state('normal')
+        self.update_status("Historical load cancelled", '#dc3545')
+        
+    def refresh_results_listbox(self):
+        """Rebuild the results list (newest first), a chunk at a time so Tk stays responsive"""
+        self._fill_generation += 1
+        self.results_listbox.delete(0, tk.END)
+        self.insert_listbox_chunk(self._display_names[::-1], 0, self._fill_generation)
+        
+    def insert_listbox_chunk(self, names, start, generation):
+        """Append one chunk of names to the results list, then schedule the next"""
+        if generation != self._fill_generation:
+            return  # List was cleared or rebuilt since this fill started
             
-            # Update UI
+        end = start + _LISTBOX_CHUNK_SIZE
+        self.results_listbox.insert(tk.END, *names[start:end])
+        if end < len(names):
+            self.root.after(0, self.insert_listbox_chunk, names, end, generation)
+        else:
             self.update_count_label()
-            self.result_text.config(state='normal')
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(1.0, "Select a result from the list to view details")
-            self.result_text.config(state='disabled')
-            self.copy_btn.config(state='disabled')
-            self.opendkp_btn.config(state='disabled')
-            self.save_btn.config(state='disabled')
-            
-            time_desc = self.format_time_description(minutes_back)
-            self.update_status(f"✅ Loaded {len(historical_results)} /who results from last {time_desc}", '#28a745')
-            
-        except Exception as e:
-            error_msg = f"Error loading historical data: {str(e)}"
-            messagebox.showerror("Error", error_msg)
-            self.update_status("❌ Failed to load historical data", '#dc3545')
-    
-    def parse_historical_who_results(self, file_path, cutoff_time):
-        """Parse the entire log file for /who results newer than cutoff_time"""
-        results = []
         
+    def set_history_buttons_state(self, state):
+        """Enable or disable the historical load buttons (Cancel is only enabled while they're not)"""
+        for btn in (self.load_5min_btn, self.load_15min_btn, self.load_1hour_btn, self.load_1day_btn):
+            btn.config(state=state)
+        self.cancel_load_btn.config(state='disabled' if state == 'normal' else 'normal')
+    
+    def parse_historical_who_results(self, file_path, cutoff_time, cancel_event=None):
+        """Parse /who results newer than cutoff_time (epoch seconds), reading the log from the end"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            lines = content.split('\n')
-            current_who = []
-            in_who_result = False
-            who_timestamp = None
-            who_datetime = None
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Look for start of /who result
-                if 'Players on EverQuest:' in line:
-                    in_who_result = True
-                    current_who = [line]
-                    
-                    # Extract and parse timestamp
-                    timestamp_match = re.match(r'^\[([^\]]+)\]', line)
-                    if timestamp_match:
-                        who_timestamp = timestamp_match.group(1)
-                        who_datetime = self.parse_eq_timestamp(who_timestamp)
-                    else:
-                        who_timestamp = datetime.now().strftime("%a %b %d %H:%M:%S %Y")
-                        who_datetime = datetime.now()
-                    
-                    continue
-                
-                if in_who_result:
-                    current_who.append(line)
-                    
-                    # Look for end of /who result
-                    if 'There are' in line and 'players in' in line:
-                        # Complete /who result found
-                        if who_datetime and who_datetime >= cutoff_time:
-                            # This result is within our time range
-                            who_content = '\n'.join(current_who)
-                            
-                            # Extract location and player count
-                            location_match = re.search(r'There are \d+ players in (.+)\.', line)
-                            location = location_match.group(1) if location_match else "Unknown"
-                            
-                            count_match = re.search(r'There are (\d+) players', line)
-                            player_count = count_match.group(1) if count_match else "?"
-                            
-                            result = {
-                                'timestamp': who_timestamp,
-                                'content': who_content,
-                                'location': location,
-                                'player_count': player_count,
-                                'display_name': f"[{who_timestamp}] {player_count} players in {location}",
-                                'datetime': who_datetime
-                            }
-                            results.append(result)
-                        
-                        in_who_result = False
-                        current_who = []
-                        who_timestamp = None
-                        who_datetime = None
+            # Very large windows are split across processes; everything else is one backwards scan
+            results = _parse_who_window_parallel(file_path, cutoff_time, cancel_event)
+            if results is None:
+                results = _parse_who_window_reverse(file_path, cutoff_time, cancel_event)
         
         except Exception as e:
             raise Exception(f"Failed to parse log file: {str(e)}")
         
-        # Sort by datetime (oldest first, will be reversed when adding to list)
-        results.sort(key=lambda x: x['datetime'])
+        # Sort by time (oldest first, will be reversed when adding to list). Both scans
+        # return newest first, so reverse before the stable sort to keep results from
+        # the same second in file order
+        results.reverse()
+        results.sort(key=lambda x: x['epoch'])
         return results
-    
-    def parse_eq_timestamp(self, timestamp_str):
-        """Parse EverQuest timestamp string to datetime object"""
-        try:
-            # EQ timestamp format: "Wed Oct 16 14:23:45 2024"
-            return datetime.strptime(timestamp_str, "%a %b %d %H:%M:%S %Y")
-        except ValueError:
-            try:
-                # Try alternative format without year
-                current_year = datetime.now().year
-                dt = datetime.strptime(f"{timestamp_str} {current_year}", "%a %b %d %H:%M:%S %Y")
-                return dt
-            except ValueError:
-                # If parsing fails, assume it's recent
-                return datetime.now()
-    
+        
     def format_time_description(self, minutes):
         """Format minutes into a human-readable description"""
         if minutes < 60:
@@ -886,7 +1340,7 @@ class EQWhoTracker:
         
     def update_count_label(self):
         """Update results count label"""
-        self.count_label.config(text=f"Results: {len(self.who_results)}")
+        self.count_label.config(text=f"Results: {len(self._contents)}")
         
     def format_file_size(self, size_bytes):
         """Format file size in human readable format"""
@@ -900,30 +1354,44 @@ class EQWhoTracker:
         return f"{size_bytes:.1f} {size_names[i]}"
         
     def load_settings(self):
-        """Load application settings"""
+        """Load application settings (read once at startup)"""
+        self._settings = {}
+        self._settings_dirty = False
         try:
             if os.path.exists(self.settings_file):
                 with open(self.settings_file, 'r') as f:
                     settings = json.load(f)
+                if isinstance(settings, dict):
+                    self._settings = settings
                     self.log_file_path = settings.get('last_log_file')
         except:
             pass  # Ignore errors loading settings
             
     def save_settings(self):
-        """Save application settings"""
+        """Record current settings; they are written to disk once on close"""
+        if self._settings.get('last_log_file') != self.log_file_path:
+            self._settings['last_log_file'] = self.log_file_path
+            self._settings_dirty = True
+            
+    def flush_settings(self):
+        """Write settings to disk if they changed"""
+        if not self._settings_dirty:
+            return
+            
         try:
-            settings = {
-                'last_log_file': self.log_file_path
-            }
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f)
+            # Write the whole dict so keys this version doesn't know about survive
+            _write_file_atomic(self.settings_file, json.dumps(self._settings).encode('utf-8'))
+            self._settings_dirty = False
         except:
             pass  # Ignore errors saving settings
             
     def on_closing(self):
         """Handle application closing"""
+        self._cancel_load.set()  # Don't wait on a historical load's workers at exit
         self.stop_monitoring_cmd()
+        self.root.after_cancel(self._drain_after_id)
         self.save_settings()
+        self.flush_settings()
         self.root.destroy()
         
     def run(self):
@@ -931,7 +1399,7 @@ class EQWhoTracker:
         self.root.mainloop()
 
 if __name__ == "__main__":
-    import sys
+    multiprocessing.freeze_support()  # Historical scan workers in the frozen .exe
     if sys.version_info < (3, 6):
         print("Error: This application requires Python 3.6 or newer")
         sys.exit(1)
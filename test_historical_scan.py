@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test script for the historical /who scans in eq_who_tracker.py
+(the backwards scan and the process-pool scan used for large windows)
+Usage: python test_historical_scan.py
+"""
+
+import os
+import tempfile
+from datetime import datetime
+
+import eq_who_tracker
+from eq_who_tracker import EQWhoTracker
+
+# Blocks A and C are complete; B never gets its "There are ..." line, and a chat
+# line quoting "There are ... players in" sits between blocks
+TEST_LOG_LINES = [
+    "[Mon Oct 14 20:00:00 2024] You say, 'raid forming'",
+    "[Mon Oct 14 20:00:05 2024] Players on EverQuest:",
+    "[Mon Oct 14 20:00:05 2024] ---------------------------",
+    "[Mon Oct 14 20:00:05 2024] [60 Warlord] Tanky (Ogre) <Denial>",
+    "[Mon Oct 14 20:00:05 2024] [ANONYMOUS] Sneaky  <Denial>",
+    "[Mon Oct 14 20:00:05 2024] There are 2 players in East Commonlands.",
+    "[Mon Oct 14 20:01:00 2024] Bob says, 'There are many players in here'",
+    "[Mon Oct 14 20:02:00 2024] Players on EverQuest:",
+    "[Mon Oct 14 20:02:00 2024] ---------------------------",
+    "[Mon Oct 14 20:02:00 2024] [50 Cleric] Lost (Dwarf)",
+    "",
+    "[Mon Oct 14 20:03:00 2024] Players on EverQuest:",
+    "[Mon Oct 14 20:03:00 2024] ---------------------------",
+    "[Mon Oct 14 20:03:00 2024] [55 Arch Mage] Pets (Erudite)",
+    "[Mon Oct 14 20:03:00 2024] There are 1 players in Plane of Knowledge.",
+    "[Mon Oct 14 20:04:00 2024] You say, 'done'",
+]
+
+BLOCK_A = ('Mon Oct 14 20:00:05 2024', '2', 'East Commonlands')
+BLOCK_C = ('Mon Oct 14 20:03:00 2024', '1', 'Plane of Knowledge')
+
+
+# Two /who results logged in the same second
+SAME_SECOND_LOG_LINES = [
+    "[Mon Oct 14 20:05:00 2024] Players on EverQuest:",
+    "[Mon Oct 14 20:05:00 2024] [60 Warlord] Tanky (Ogre) <Denial>",
+    "[Mon Oct 14 20:05:00 2024] There are 1 players in East Commonlands.",
+    "[Mon Oct 14 20:05:00 2024] Players on EverQuest:",
+    "[Mon Oct 14 20:05:00 2024] [55 Arch Mage] Pets (Erudite)",
+    "[Mon Oct 14 20:05:00 2024] There are 1 players in Plane of Knowledge.",
+]
+
+
+def write_log(newline, lines=TEST_LOG_LINES):
+    """Write lines to a temp file with the given line ending; returns its path"""
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+        f.write(newline.join(lines) + newline)
+    return path
+
+def epoch(timestamp):
+    return datetime.strptime(timestamp, "%a %b %d %H:%M:%S %Y").timestamp()
+
+def summarize(results):
+    """Oldest first, as parse_historical_who_results returns them"""
+    results = sorted(results, key=lambda r: r['epoch'])
+    return [(r['timestamp'], r['player_count'], r['location']) for r in results]
+
+def scan_parallel(path, cutoff_time, scan=eq_who_tracker._parse_who_window_parallel):
+    """Run scan with the process-pool thresholds lowered for a small file"""
+    saved = eq_who_tracker._PARALLEL_SCAN_MIN_BYTES, eq_who_tracker.os.cpu_count
+    eq_who_tracker._PARALLEL_SCAN_MIN_BYTES = 1
+    eq_who_tracker.os.cpu_count = lambda: 3
+    try:
+        results = scan(path, cutoff_time)
+    finally:
+        eq_who_tracker._PARALLEL_SCAN_MIN_BYTES, eq_who_tracker.os.cpu_count = saved
+    assert results is not None, "process-pool scan fell back"
+    return results
+
+def check_scans(newline, cutoff_time, expected):
+    path = write_log(newline)
+    try:
+        reverse = eq_who_tracker._parse_who_window_reverse(path, cutoff_time)
+        assert summarize(reverse) == expected, summarize(reverse)
+        for result in reverse:
+            assert '\r' not in result['content']
+            assert result['content'].startswith(f"[{result['timestamp']}] Players on EverQuest:")
+
+        parallel = scan_parallel(path, cutoff_time)
+        assert summarize(parallel) == expected, summarize(parallel)
+        assert [r['content'] for r in parallel] == [r['content'] for r in reverse]
+    finally:
+        os.remove(path)
+
+def test_complete_blocks_only():
+    check_scans('\n', 0, [BLOCK_A, BLOCK_C])
+
+def test_crlf_log():
+    check_scans('\r\n', 0, [BLOCK_A, BLOCK_C])
+
+def test_cutoff_between_blocks():
+    check_scans('\n', epoch('Mon Oct 14 20:01:00 2024'), [BLOCK_C])
+    check_scans('\r\n', epoch('Mon Oct 14 20:01:00 2024'), [BLOCK_C])
+
+def test_cutoff_after_all_blocks():
+    check_scans('\n', epoch('Mon Oct 14 20:10:00 2024'), [])
+
+def test_same_second_keeps_file_order():
+    path = write_log('\n', SAME_SECOND_LOG_LINES)
+    try:
+        expected = ['East Commonlands', 'Plane of Knowledge']
+        # parse_historical_who_results doesn't touch the window
+        serial = EQWhoTracker.parse_historical_who_results(None, path, 0)
+        assert [r['location'] for r in serial] == expected
+        parallel = scan_parallel(path, 0, lambda p, c: EQWhoTracker.parse_historical_who_results(None, p, c))
+        assert [r['location'] for r in parallel] == expected
+    finally:
+        os.remove(path)
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+    print("All historical scan checks passed")
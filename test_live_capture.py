@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test script for live /who capture in eq_who_tracker.py
+(read_new_content picking up a block that EverQuest writes across several reads)
+Usage: python test_live_capture.py
+"""
+
+import os
+import queue
+import tempfile
+import threading
+
+from eq_who_tracker import EQWhoTracker
+
+WHO_BLOCK_LINES = [
+    "[Mon Oct 14 20:00:05 2024] Players on EverQuest:\n",
+    "[Mon Oct 14 20:00:05 2024] ---------------------------\n",
+    "[Mon Oct 14 20:00:05 2024] [60 Warlord] Tanky (Ogre) <Denial>\n",
+    "[Mon Oct 14 20:00:05 2024] There are 1 players in East Commonlands.\n",
+]
+
+EXPECTED = ("[Mon Oct 14 20:00:05 2024] Players on EverQuest:\n"
+            "[Mon Oct 14 20:00:05 2024] ---------------------------\n"
+            "[Mon Oct 14 20:00:05 2024] [60 Warlord] Tanky (Ogre) <Denial>\n"
+            "[Mon Oct 14 20:00:05 2024] There are 1 players in East Commonlands.",
+            "Mon Oct 14 20:00:05 2024")
+
+
+def make_tracker(log_path):
+    """Just the monitoring state read_new_content needs - no Tk window"""
+    tracker = EQWhoTracker.__new__(EQWhoTracker)
+    tracker.log_file_path = log_path
+    tracker.last_file_size = os.path.getsize(log_path)
+    tracker._read_lock = threading.Lock()
+    tracker._result_queue = queue.Queue()
+    tracker.reset_live_parser()
+    return tracker
+
+def captured(tracker):
+    items = []
+    while not tracker._result_queue.empty():
+        items.append(tracker._result_queue.get_nowait())
+    return items
+
+def feed_in_writes(writes):
+    """Append each string in writes to a log, reading new content after each one"""
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write("[Mon Oct 14 20:00:00 2024] You say, 'raid forming'\n")
+        tracker = make_tracker(path)
+        for data in writes:
+            with open(path, 'a', encoding='utf-8', newline='') as f:
+                f.write(data)
+            tracker.read_new_content()
+        return captured(tracker)
+    finally:
+        os.remove(path)
+
+def test_block_in_one_write():
+    assert feed_in_writes([''.join(WHO_BLOCK_LINES)]) == [EXPECTED]
+
+def test_block_one_line_per_read():
+    assert feed_in_writes(WHO_BLOCK_LINES) == [EXPECTED]
+
+def test_line_split_across_reads():
+    footer = WHO_BLOCK_LINES[-1]
+    writes = WHO_BLOCK_LINES[:-1] + [footer[:50], footer[50:]]
+    assert feed_in_writes(writes) == [EXPECTED]
+    # A start line split mid-marker too
+    header = WHO_BLOCK_LINES[0]
+    writes = [header[:38], header[38:]] + WHO_BLOCK_LINES[1:]
+    assert feed_in_writes(writes) == [EXPECTED]
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+    print("All live capture checks passed")
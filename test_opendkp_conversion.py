@@ -1,139 +1,15 @@
 #!/usr/bin/env python3
 """
-Quick test script to demonstrate OpenDKP conversion functionality
+Test script for the OpenDKP conversion shipped in eq_who_tracker.py
+Usage: python test_opendkp_conversion.py
 """
 
-import re
+from eq_who_tracker import _iter_opendkp_lines
+
 
 def convert_to_opendkp_format(who_content):
-    """Convert /who result content to OpenDKP tab-separated format"""
-    lines = who_content.split('\n')
-    opendkp_lines = []
-    
-    # Class name mapping for consistency (including EQ class titles)
-    class_mappings = {
-        # Standard classes
-        'warrior': 'Warrior',
-        'paladin': 'Paladin',
-        'ranger': 'Ranger',
-        'shadow knight': 'Shadow Knight',
-        'monk': 'Monk',
-        'bard': 'Bard',
-        'rogue': 'Rogue',
-        'shaman': 'Shaman',
-        'necromancer': 'Necromancer',
-        'wizard': 'Wizard',
-        'magician': 'Magician',
-        'enchanter': 'Enchanter',
-        'druid': 'Druid',
-        'cleric': 'Cleric',
-        'beastlord': 'Beastlord',
-        'berserker': 'Berserker',
-        
-        # Enchanter titles
-        'phantasmist': 'Enchanter',
-        'illusionist': 'Enchanter',
-        'beguiler': 'Enchanter',
-        'arch convoker': 'Enchanter',
-        'coercer': 'Enchanter',
-        
-        # Magician titles
-        'conjurer': 'Magician',
-        'elementalist': 'Magician',
-        'arch mage': 'Magician',
-        
-        # Wizard titles
-        'warlock': 'Wizard',
-        'sorcerer': 'Wizard',
-        'arcanist': 'Wizard',
-        
-        # Warrior titles
-        'myrmidon': 'Warrior',
-        'champion': 'Warrior',
-        'overlord': 'Warrior',
-        'warlord': 'Warrior',
-        
-        # Monk titles
-        'master': 'Monk',
-        'grandmaster': 'Monk',
-        'transcendent': 'Monk',
-        
-        # Cleric/Paladin titles
-        'templar': 'Paladin',
-        'crusader': 'Paladin',
-        'knight': 'Paladin',
-        'cavalier': 'Paladin',
-        
-        # Shadow Knight titles
-        'heretic': 'Shadow Knight',
-        'reaver': 'Shadow Knight',
-        'blackguard': 'Shadow Knight',
-        
-        # Common alternatives
-        'sk': 'Shadow Knight',
-        'shadowknight': 'Shadow Knight',
-        'enc': 'Enchanter',
-        'mag': 'Magician',
-        'wiz': 'Wizard',
-        'nec': 'Necromancer',
-        'war': 'Warrior',
-        'pal': 'Paladin',
-        'ran': 'Ranger',
-        'rog': 'Rogue',
-        'mnk': 'Monk',
-        'shm': 'Shaman',
-        'dru': 'Druid',
-        'cle': 'Cleric',
-        'bst': 'Beastlord',
-        'ber': 'Berserker',
-        
-        # Alternative names
-        'minstrel': 'Bard',
-        'troubadour': 'Bard',
-        'unknown': 'Unknown',
-    }
-    
-    for line in lines:
-        line = line.strip()
-        
-        if not line or 'Players on EverQuest' in line or line.startswith('---') or line.startswith('There are'):
-            continue
-        
-        # Remove timestamp from beginning if present
-        if line.startswith('[') and '] [' in line:
-            # Extract everything after the timestamp
-            parts = line.split('] ', 1)
-            if len(parts) > 1:
-                line = parts[1]
-        
-        # Parse player lines - look for [Level ClassTitle] Name or [ANONYMOUS] Name
-        player_match = None
-        
-        # Try to match [Level ClassTitle] PlayerName (Race) <Guild> pattern first
-        player_match = re.match(r'^\[(\d+)\s+([A-Za-z ]+)\]\s+([A-Za-z0-9_]+)', line)
-        if player_match:
-            level = player_match.group(1)
-            class_name = player_match.group(2).strip()
-            player_name = player_match.group(3).strip()
-        else:
-            # Try to match [ANONYMOUS] PlayerName pattern
-            anon_match = re.match(r'^\[ANONYMOUS\]\s+([A-Za-z0-9_]+)', line)
-            if anon_match:
-                level = "0"  # Unknown level for anonymous
-                class_name = "Unknown"  # No class info for anonymous
-                player_name = anon_match.group(1).strip()
-            else:
-                continue  # Skip lines we can't parse
-        
-        # Normalize class name
-        class_name_lower = class_name.lower()
-        normalized_class = class_mappings.get(class_name_lower, class_name)
-        
-        # Create OpenDKP format: 0\tPlayerName\tLevel\tClass
-        opendkp_line = f"0\t{player_name}\t{level}\t{normalized_class}"
-        opendkp_lines.append(opendkp_line)
-    
-    return '\n'.join(opendkp_lines)
+    """Same conversion EQWhoTracker.convert_to_opendkp_format returns"""
+    return '\n'.join(_iter_opendkp_lines(who_content))
 
 # Test with actual EQ data format
 test_who_content = """[Tue Jul 01 22:08:30 2025] Players on EverQuest:
@@ -141,23 +17,105 @@ test_who_content = """[Tue Jul 01 22:08:30 2025] Players on EverQuest:
 [Tue Jul 01 22:08:30 2025] [60 Phantasmist] Accosted (Dark Elf) <Denial>
 [Tue Jul 01 22:08:30 2025] [51 Illusionist] Drokoth (High Elf) <Denial> LFG
 [Tue Jul 01 22:08:30 2025] [57 Conjurer] Kilowattz (Gnome) <Denial>
-[Tue Jul 01 22:08:30 2025] [ANONYMOUS] Toad 
+[Tue Jul 01 22:08:30 2025] [ANONYMOUS] Toad
 [Tue Jul 01 22:08:30 2025] [ANONYMOUS] Akuppee  <Denial>
 [Tue Jul 01 22:08:30 2025] [52 Heretic] Luciferianism (Skeleton) <Denial>
 [Tue Jul 01 22:08:30 2025] [60 Arch Mage] Hakaresh (Erudite) <Denial>
 [Tue Jul 01 22:08:30 2025] [55 Myrmidon] Kawaiinomu (Gnome) <CUTE>
 [Tue Jul 01 22:08:30 2025] There are 24 players in Kael Drakkal."""
 
-print("Original /who data:")
-print("=" * 50)
-print(test_who_content)
-print("\n\nConverted OpenDKP format:")
-print("=" * 50)
-converted = convert_to_opendkp_format(test_who_content)
-print(converted)
-print("\n\nFormat explanation:")
-print("Each line is: 0\\tPlayerName\\tLevel\\tClass")
-print("- First column: Always '0' (placeholder)")
-print("- Second column: Character name")
-print("- Third column: Character level (0 for ANONYMOUS)")
-print("- Fourth column: Normalized class name")
\ No newline at end of file
+
+def check(who_content, expected_rows):
+    """Assert the conversion produces exactly expected_rows"""
+    converted = convert_to_opendkp_format(who_content)
+    expected = '\n'.join('\t'.join(row) for row in expected_rows)
+    assert converted == expected, f"\nexpected:\n{expected}\ngot:\n{converted}"
+
+def test_sample_who():
+    check(test_who_content, [
+        ('0', 'Accosted', '60', 'Enchanter'),
+        ('0', 'Drokoth', '51', 'Enchanter'),
+        ('0', 'Kilowattz', '57', 'Magician'),
+        ('0', 'Toad', '0', 'Unknown'),
+        ('0', 'Akuppee', '0', 'Unknown'),
+        ('0', 'Luciferianism', '52', 'Shadow Knight'),
+        ('0', 'Hakaresh', '60', 'Magician'),
+        ('0', 'Kawaiinomu', '55', 'Warrior'),
+    ])
+
+def test_anonymous():
+    check("[Tue Jul 01 22:08:30 2025] [ANONYMOUS] Sneaky\n"
+          "[Tue Jul 01 22:08:30 2025] [ANONYMOUS] Guilded  <Denial>\n"
+          "[ANONYMOUS] NoStamp", [
+        ('0', 'Sneaky', '0', 'Unknown'),
+        ('0', 'Guilded', '0', 'Unknown'),
+        ('0', 'NoStamp', '0', 'Unknown'),
+    ])
+
+def test_roleplay_and_lfg_flags():
+    check("[Tue Jul 01 22:08:30 2025] [54 Templar] Storyteller (Human) <Denial> ROLEPLAY\n"
+          "[Tue Jul 01 22:08:30 2025] [51 Illusionist] Drokoth (High Elf) <Denial> LFG\n"
+          "[Tue Jul 01 22:08:30 2025] [50 Warrior] Tank (Ogre) LFG", [
+        ('0', 'Storyteller', '54', 'Paladin'),
+        ('0', 'Drokoth', '51', 'Enchanter'),
+        ('0', 'Tank', '50', 'Warrior'),
+    ])
+
+def test_guildless():
+    check("[Tue Jul 01 22:08:30 2025] [60 Arch Mage] Hakaresh (Erudite)\n"
+          "[Tue Jul 01 22:08:30 2025] [55 Shadow Knight] Darkblade (Iksar)", [
+        ('0', 'Hakaresh', '60', 'Magician'),
+        ('0', 'Darkblade', '55', 'Shadow Knight'),
+    ])
+
+def test_class_names():
+    check("[10 Grandmaster] Kicks (Human)\n"
+          "[10 shadow knight] Lower (Troll)\n"
+          "[10 Beastlord] Pets (Vah Shir)\n"
+          "[10 Newclass] Future (Human)", [
+        ('0', 'Kicks', '10', 'Monk'),
+        ('0', 'Lower', '10', 'Shadow Knight'),
+        ('0', 'Pets', '10', 'Beastlord'),
+        ('0', 'Future', '10', 'Newclass'),
+    ])
+
+def test_skipped_lines():
+    check("[Tue Jul 01 22:08:30 2025] Players on EverQuest:\n"
+          "[Tue Jul 01 22:08:30 2025] ---------------------------\n"
+          "[Tue Jul 01 22:08:30 2025] Bob says, 'There are 3 players in here'\n"
+          "[Tue Jul 01 22:08:30 2025] [55Warrior] Nospace (Human)\n"
+          "[Tue Jul 01 22:08:30 2025] [50 Warrior]Squashed (Human)\n"
+          "[Tue Jul 01 22:08:30 2025] [ 55 Warrior] Padded (Human)\n"
+          "[Tue Jul 01 22:08:30 2025] [50 Warrior] (Human)\n"
+          "[Tue Jul 01 22:08:30 2025] There are 0 players in Kael Drakkal.", [])
+
+def test_name_and_spacing_edges():
+    check("  [50 Warrior] Indented (Human)\n"
+          "[55  Shadow Knight ] Spaced (Iksar)\n"
+          "[50 Warrior] Name-Dash (Human)\n"
+          "[50 Warrior]\tTabbed (Human)\r", [
+        ('0', 'Indented', '50', 'Warrior'),
+        ('0', 'Spaced', '55', 'Shadow Knight'),
+        ('0', 'Name', '50', 'Warrior'),
+        ('0', 'Tabbed', '50', 'Warrior'),
+    ])
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+    print("All OpenDKP conversion checks passed\n")
+
+    print("Original /who data:")
+    print("=" * 50)
+    print(test_who_content)
+    print("\n\nConverted OpenDKP format:")
+    print("=" * 50)
+    converted = convert_to_opendkp_format(test_who_content)
+    print(converted)
+    print("\n\nFormat explanation:")
+    print("Each line is: 0\\tPlayerName\\tLevel\\tClass")
+    print("- First column: Always '0' (placeholder)")
+    print("- Second column: Character name")
+    print("- Third column: Character level (0 for ANONYMOUS)")
+    print("- Fourth column: Normalized class name")